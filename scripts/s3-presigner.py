@@ -6,220 +6,399 @@ This server accepts metadata URLs and returns properly signed URLs that the brow
 
 import argparse
 import json
-import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
-import datetime
+import functools
+import re
+import socket
+import sys
+import threading
 import time
 
+# Prefer a C JSON encoder when available; the script still runs with only the stdlib.
+# json_loads accepts bytes directly and raises a ValueError subclass on bad input.
+try:
+    import orjson
+
+    def json_dumps(obj, pretty=False):
+        """Serialize obj to JSON bytes"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+    json_loads = orjson.loads
+except ImportError:
+    def json_dumps(obj, pretty=False):
+        """Serialize obj to JSON bytes"""
+        return json.dumps(obj, indent=2 if pretty else None).encode()
+
+    json_loads = json.loads
+
+
+# Matches virtual-hosted (https://bucket.s3[.region].amazonaws.com/key) and
+# path-style (https://s3[.region].amazonaws.com/bucket/key) S3 URLs, where the optional
+# region is joined with '.' or the legacy '-'. Only real region names are accepted, so
+# website, dualstack and other special endpoints don't match.
+# Groups: 1 = virtual-hosted bucket, 2 = its region, 3 = path-style region, 4 = its bucket, 5 = key
+_S3_REGION = r'[a-z]{2}(?:-[a-z]+)+-\d+'
+_S3_URL_RE = re.compile(
+    r'^https?://(?:'
+    r'([A-Za-z0-9._-]+?)\.s3(?:[.-](' + _S3_REGION + r'))?\.amazonaws\.com'
+    r'|s3(?:[.-](' + _S3_REGION + r'))?\.amazonaws\.com/([A-Za-z0-9._-]+)'
+    r')/([^?#]+)'
+)
+
+# Shared configuration for all S3 clients
+S3_CLIENT_CONFIG = Config(signature_version='s3v4', retries={'max_attempts': 1})
+
+# Largest POST body accepted; requests are small JSON objects
+MAX_BODY_SIZE = 64 * 1024
+
+# Maximum number of raw request body bytes shown in verbose logs
+LOG_BODY_LIMIT = 256
+
+# Presigned URLs are reused for up to this many seconds, so repeated requests for
+# the same object skip re-signing. URLs with a short lifetime are always signed fresh.
+PRESIGN_CACHE_WINDOW = 60
+
+
+# SigV4 presigned URLs can be valid for at most 7 days
+MAX_EXPIRES_IN = 7 * 24 * 3600
+
+
+def sign_presigned_url(s3_client, bucket, key, expires_in):
+    """Sign a get_object URL and return (url, signing time)"""
+    signed_at = time.time()
+    presigned_url = s3_client.generate_presigned_url(
+        'get_object',
+        Params={'Bucket': bucket, 'Key': key},
+        ExpiresIn=expires_in
+    )
+    return presigned_url, signed_at
+
+
+@functools.lru_cache(maxsize=1024)
+def cached_presigned_url(s3_client, bucket, key, expires_in, window):
+    """Cached sign_presigned_url(); window only partitions the cache by time"""
+    return sign_presigned_url(s3_client, bucket, key, expires_in)
+
+
+# Constant response headers, pre-encoded so each response goes out in a single write
+_OK_HEADERS = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Access-Control-Allow-Origin: *\r\n"
+)
+_OPTIONS_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+    b"Access-Control-Allow-Headers: Content-Type\r\n"
+    b"Content-Length: 0\r\n"
+    b"\r\n"
+)
+
+# (epoch second, formatted timestamp) of the last log line; replaced as a whole so
+# concurrent handler threads never see a mismatched pair
+_last_timestamp = (0, '')
+
+
+def log_timestamp():
+    """Return the current local time formatted for logs, reformatting at most once per second"""
+    global _last_timestamp
+    now = int(time.time())
+    if now != _last_timestamp[0]:
+        _last_timestamp = (now, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now)))
+    return _last_timestamp[1]
+
 
 class S3PresignerHandler(BaseHTTPRequestHandler):
+    # Keep connections open between requests; every response sends Content-Length
+    protocol_version = 'HTTP/1.1'
+    # Close idle keep-alive connections so they don't hold a worker thread forever
+    timeout = 15
+    # Set TCP_NODELAY so small responses aren't delayed by Nagle's algorithm
+    disable_nagle_algorithm = True
+    # Read request line, headers and body through one large buffer (fewer recv calls);
+    # writes stay unbuffered since each response is already assembled into a single write
+    rbufsize = 65536
+    wbufsize = 0
+    # Verbose-mode lines produced while handling the current request; reset by each do_*
+    # method and written as part of that request's log block
+    log_notes = ()
+
+    def log_request_summary(self, method, status_code=200, error=None):
+        """Log a single line per request (default, non-verbose mode)"""
+        timestamp = log_timestamp()
+        line = f"[{timestamp}] {method} {self.path} -> {status_code}"
+        if error:
+            line += f" ({error})"
+        sys.stdout.write(line + '\n')
+
+    def log_exchange(self, method, request_data=None, response_data=None, status_code=200, error=None, raw_data=None):
+        """Log a request according to the server's --verbose/--quiet settings"""
+        if self.server.verbose:
+            if method == 'POST':
+                self.log_request_response_debug(method, request_data, response_data, status_code, error, raw_data)
+            else:
+                self.log_request_response(method, request_data, response_data, status_code, error)
+        elif not self.server.quiet:
+            self.log_request_summary(method, status_code, error)
+
     def log_request_response(self, method, request_data=None, response_data=None, status_code=200, error=None):
         """Log request and response with timestamp"""
-        timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = log_timestamp()
         client_ip = self.client_address[0]
         
-        print(f"\n{'='*80}")
-        print(f"[{timestamp}] {method} Request from {client_ip}")
-        print(f"Path: {self.path}")
+        # Collect the whole block and write it at once, so concurrent requests don't interleave
+        parts = [
+            f"\n{'='*80}",
+            f"[{timestamp}] {method} Request from {client_ip}",
+            f"Path: {self.path}",
+        ]
         
         # Log request headers
-        print(f"Headers:")
-        for header, value in self.headers.items():
-            print(f"  {header}: {value}")
+        parts.append("Headers:")
+        parts.append('\n'.join(f"  {header}: {value}" for header, value in self.headers.items()))
         
         # Log request data
         if request_data:
-            print(f"Request Body:")
-            if isinstance(request_data, dict):
-                print(f"  {json.dumps(request_data, indent=2)}")
-            else:
-                print(f"  {request_data}")
+            parts.append("Request Body:")
+            parts.append(self.format_log_data(request_data))
         
         # Log response
-        print(f"Response Status: {status_code}")
+        parts.extend(self.log_notes)
+        parts.append(f"Response Status: {status_code}")
         if response_data:
-            print(f"Response Body:")
-            if isinstance(response_data, dict):
-                print(f"  {json.dumps(response_data, indent=2)}")
-            else:
-                print(f"  {response_data}")
+            parts.append("Response Body:")
+            parts.append(self.format_log_data(response_data))
         
         if error:
-            print(f"Error: {error}")
+            parts.append(f"Error: {error}")
         
-        print(f"{'='*80}\n")
+        parts.append(f"{'='*80}\n")
+        sys.stdout.write('\n'.join(parts) + '\n')
 
     def log_request_response_debug(self, method, request_data=None, response_data=None, status_code=200, error=None, raw_data=None):
         """Enhanced debug logging with raw data"""
-        timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = log_timestamp()
         client_ip = self.client_address[0]
         
-        print(f"\n{'='*80}")
-        print(f"[{timestamp}] {method} Request from {client_ip}")
-        print(f"Path: {self.path}")
+        # Collect the whole block and write it at once, so concurrent requests don't interleave
+        parts = [
+            f"\n{'='*80}",
+            f"[{timestamp}] {method} Request from {client_ip}",
+            f"Path: {self.path}",
+        ]
         
         # Log request headers
-        print(f"Headers:")
-        for header, value in self.headers.items():
-            print(f"  {header}: {value}")
+        parts.append("Headers:")
+        parts.append('\n'.join(f"  {header}: {value}" for header, value in self.headers.items()))
         
-        # Log raw data if available
+        # Log raw data if available, truncated so large bodies aren't copied just for logging
         if raw_data is not None:
-            print(f"Raw Request Data ({len(raw_data)} bytes):")
-            print(f"  Hex: {raw_data.hex()}")
-            print(f"  ASCII: {repr(raw_data)}")
-            try:
-                decoded = raw_data.decode('utf-8')
-                print(f"  UTF-8: '{decoded}'")
-            except UnicodeDecodeError:
-                print(f"  UTF-8: <decode error>")
+            parts.append(f"Raw Request Data ({len(raw_data)} bytes): {raw_data[:LOG_BODY_LIMIT]!r}")
         
         # Log parsed request data
         if request_data:
-            print(f"Parsed Request Data:")
-            if isinstance(request_data, dict):
-                print(f"  {json.dumps(request_data, indent=2)}")
-            else:
-                print(f"  {request_data}")
+            parts.append("Parsed Request Data:")
+            parts.append(self.format_log_data(request_data))
         
         # Log response
-        print(f"Response Status: {status_code}")
+        parts.extend(self.log_notes)
+        parts.append(f"Response Status: {status_code}")
         if response_data:
-            print(f"Response Body:")
-            if isinstance(response_data, dict):
-                print(f"  {json.dumps(response_data, indent=2)}")
-            else:
-                print(f"  {response_data}")
+            parts.append("Response Body:")
+            parts.append(self.format_log_data(response_data))
         
         if error:
-            print(f"Error: {error}")
+            parts.append(f"Error: {error}")
         
-        print(f"{'='*80}\n")
+        parts.append(f"{'='*80}\n")
+        sys.stdout.write('\n'.join(parts) + '\n')
+
+    def format_log_data(self, data):
+        """Format request/response data for the verbose logs"""
+        if isinstance(data, dict):
+            return f"  {json_dumps(data, pretty=True).decode()}"
+        return f"  {data}"
+
+    def send_json(self, status_code, response_data, pretty=False, close=False):
+        """Serialize response_data and send it as the complete response; close=True also ends the keep-alive connection"""
+        body = json_dumps(response_data, pretty=pretty)
+        if status_code == 200 and not close:
+            # Pre-encoded headers and body in a single write
+            self.wfile.write(_OK_HEADERS + b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body)
+            return
+
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Content-Length', str(len(body)))
+        if close:
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(body)
 
     def do_OPTIONS(self):
         """Handle CORS preflight requests"""
-        self.log_request_response('OPTIONS', status_code=200)
+        self.log_notes = []
+        self.log_exchange('OPTIONS', status_code=200)
         
-        self.send_response(200)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-        self.end_headers()
+        self.wfile.write(_OPTIONS_RESPONSE)
 
     def do_GET(self):
         """Handle GET requests with URL parameter"""
         start_time = time.time()
+        self.log_notes = []
         request_data = None
         response_data = None
         status_code = 200
         error = None
+        pretty = False
         
         try:
-            # Parse the query parameters
+            # Parse the query parameters (parse_qs already returns a {name: [values]} dict)
             parsed_url = urlparse(self.path)
-            query_params = parse_qs(parsed_url.query)
-            request_data = dict(query_params)
-            
-            # Enable CORS
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
+            request_data = parse_qs(parsed_url.query)
+            # Compact JSON for the extension; ?pretty=1 indents it for humans
+            pretty = request_data.get('pretty') == ['1']
 
-            if 'url' not in query_params:
+            urls = request_data.get('url')
+            if not urls:
+                status_code = 400
                 response_data = {
                     'error': 'Missing url parameter',
                     'usage': 'GET /?url=https://fleetdata-production.s3.amazonaws.com/...'
                 }
                 error = 'Missing url parameter'
-                self.wfile.write(json.dumps(response_data).encode())
                 return
 
-            s3_url = query_params['url'][0]
-            presigned_url = self.generate_presigned_url_from_s3_url(s3_url)
+            s3_url = urls[0]
+            presigned_url, expires_in = self.generate_presigned_url_from_s3_url(s3_url)
             
             response_data = {
                 'original_url': s3_url,
                 'presigned_url': presigned_url,
-                'expires_in': 3600,
+                'expires_in': expires_in,
                 'status': 'success',
                 'processing_time_ms': round((time.time() - start_time) * 1000, 2)
             }
             
-            self.wfile.write(json.dumps(response_data, indent=2).encode())
-            
         except Exception as e:
             status_code = 500
             error = str(e)
             
-            self.send_response(500)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
             response_data = {
                 'error': str(e),
                 'status': 'error',
                 'processing_time_ms': round((time.time() - start_time) * 1000, 2)
             }
-            self.wfile.write(json.dumps(response_data).encode())
         
         finally:
-            self.log_request_response('GET', request_data, response_data, status_code, error)
+            # Send the response exactly once, whichever path produced it
+            try:
+                self.send_json(status_code, response_data, pretty=pretty)
+            finally:
+                self.log_exchange('GET', request_data, response_data, status_code, error)
 
     def do_POST(self):
         """Handle POST requests with JSON body"""
         start_time = time.time()
+        self.log_notes = []
         request_data = None
         response_data = None
         status_code = 200
         error = None
         raw_post_data = None
+        close = False
         
         try:
-            # Enable CORS
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-
-            # Read the request body
-            content_length = int(self.headers['Content-Length'])
-            raw_post_data = self.rfile.read(content_length)
+            # Validate Content-Length before reading so the body size is bounded.
+            # Only plain ASCII digits are accepted (no signs, underscores or prefixes).
+            content_length_values = self.headers.get_all('Content-Length', [])
+            if not content_length_values:
+                status_code = 411
+                error = 'Missing Content-Length header'
+            elif len(content_length_values) > 1 or not (content_length_values[0].isascii() and content_length_values[0].isdigit()):
+                status_code = 400
+                error = 'Invalid Content-Length header'
+            elif len(content_length_values[0]) > len(str(MAX_BODY_SIZE)) or int(content_length_values[0]) > MAX_BODY_SIZE:
+                # The digit count is checked first so int() never sees huge digit strings
+                status_code = 413
+                error = f'Request body too large (limit {MAX_BODY_SIZE} bytes)'
             
-            print(f"Raw POST data ({content_length} bytes): {raw_post_data}")
+            if error:
+                # The body is left unread, so the connection can't be reused
+                close = True
+                response_data = {
+                    'error': error,
+                    'status': 'error'
+                }
+                return
+            
+            # Read the request body; if it fails or comes up short, the rest of the body
+            # may still arrive later, so the connection can't be reused either
+            content_length = int(content_length_values[0])
+            close = True
+            try:
+                raw_post_data = self.rfile.read(content_length)
+            except socket.timeout:
+                status_code = 408
+                error = 'Timed out reading request body'
+            else:
+                if len(raw_post_data) < content_length:
+                    status_code = 400
+                    error = f'Request body shorter than Content-Length ({len(raw_post_data)} of {content_length} bytes)'
+            
+            if error:
+                response_data = {
+                    'error': error,
+                    'status': 'error'
+                }
+                return
+            close = False
             
             # Parse JSON
             try:
-                request_data = json.loads(raw_post_data.decode('utf-8'))
-                print(f"Parsed JSON successfully: {request_data}")
-            except json.JSONDecodeError as e:
+                request_data = json_loads(raw_post_data)
+                if self.server.verbose:
+                    self.log_notes.append(f"Parsed JSON successfully: {request_data}")
+            except ValueError as e:
+                status_code = 400
                 response_data = {
                     'error': 'Invalid JSON in request body',
                     'details': str(e),
                     'raw_data': raw_post_data.decode('utf-8', errors='ignore')
                 }
                 error = f'JSON decode error: {e}'
-                self.wfile.write(json.dumps(response_data).encode())
                 return
 
             if 'url' not in request_data:
+                status_code = 400
                 response_data = {
                     'error': 'Missing url in JSON body',
                     'usage': 'POST with JSON: {"url": "https://fleetdata-production.s3.amazonaws.com/..."}',
                     'received_data': request_data
                 }
                 error = 'Missing url in request body'
-                self.wfile.write(json.dumps(response_data).encode())
                 return
 
             s3_url = request_data['url']
             expires_in = request_data.get('expires_in', 3600)  # Default 1 hour
+            # bool is an int subclass, so it is excluded explicitly
+            if type(expires_in) is not int or not 0 < expires_in <= MAX_EXPIRES_IN:
+                status_code = 400
+                response_data = {
+                    'error': f'expires_in must be an integer number of seconds between 1 and {MAX_EXPIRES_IN}',
+                    'received_data': request_data
+                }
+                error = 'Invalid expires_in in request body'
+                return
             
-            presigned_url = self.generate_presigned_url_from_s3_url(s3_url, expires_in)
+            presigned_url, expires_in = self.generate_presigned_url_from_s3_url(s3_url, expires_in)
             
             response_data = {
                 'original_url': s3_url,
@@ -229,27 +408,23 @@ class S3PresignerHandler(BaseHTTPRequestHandler):
                 'processing_time_ms': round((time.time() - start_time) * 1000, 2)
             }
             
-            self.wfile.write(json.dumps(response_data, indent=2).encode())
-            
         except Exception as e:
             status_code = 500
             error = str(e)
             
-            self.send_response(500)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
             response_data = {
                 'error': str(e),
                 'status': 'error',
                 'processing_time_ms': round((time.time() - start_time) * 1000, 2)
             }
-            self.wfile.write(json.dumps(response_data).encode())
         
         finally:
-            # Enhanced logging for debugging
-            self.log_request_response_debug('POST', request_data, response_data, status_code, error, raw_post_data)
+            # Send the response exactly once, whichever path produced it
+            try:
+                self.send_json(status_code, response_data, close=close)
+            finally:
+                # Enhanced logging for debugging when --verbose is set
+                self.log_exchange('POST', request_data, response_data, status_code, error, raw_post_data)
 
     def generate_presigned_url_from_s3_url(self, s3_url, expires_in=3600):
         """
@@ -257,47 +432,39 @@ class S3PresignerHandler(BaseHTTPRequestHandler):
         
         :param s3_url: The S3 URL (e.g., https://fleetdata-production.s3.amazonaws.com/path/to/file.txt)
         :param expires_in: Expiration time in seconds
-        :return: Presigned URL
+        :return: (presigned URL, seconds it remains valid) - less than expires_in when a cached URL is reused
         """
         start_time = time.time()
         
         try:
             # Parse the S3 URL to extract bucket and key
-            parsed = urlparse(s3_url)
-            
-            # Handle different S3 URL formats
-            if '.s3.amazonaws.com' in parsed.netloc:
-                # Format: https://bucket-name.s3.amazonaws.com/key
-                bucket = parsed.netloc.split('.s3.amazonaws.com')[0]
-                key = parsed.path.lstrip('/')
-            elif parsed.netloc == 's3.amazonaws.com':
-                # Format: https://s3.amazonaws.com/bucket-name/key
-                path_parts = parsed.path.lstrip('/').split('/', 1)
-                bucket = path_parts[0]
-                key = path_parts[1] if len(path_parts) > 1 else ''
-            else:
+            match = _S3_URL_RE.match(s3_url)
+            if match is None:
                 raise ValueError(f"Unrecognized S3 URL format: {s3_url}")
 
-            if not bucket or not key:
-                raise ValueError(f"Could not extract bucket and key from URL: {s3_url}")
+            bucket = match.group(1) or match.group(4)
+            region = match.group(2) or match.group(3)
+            key = match.group(5)
 
-            parse_time = time.time()
-            print(f"URL parsing completed in {round((parse_time - start_time) * 1000, 2)}ms")
-            print(f"Generating presigned URL for bucket='{bucket}', key='{key}', expires_in={expires_in}s")
+            if self.server.verbose:
+                parse_time = time.time()
+                self.log_notes.append(f"URL parsing completed in {round((parse_time - start_time) * 1000, 2)}ms")
+                self.log_notes.append(f"Generating presigned URL for bucket='{bucket}', key='{key}', expires_in={expires_in}s")
 
-            # Create S3 client (uses AWS credentials from environment/config)
-            s3_client = boto3.client('s3')
-            
-            # Generate presigned URL
-            presigned_url = s3_client.generate_presigned_url(
-                'get_object',
-                Params={'Bucket': bucket, 'Key': key},
-                ExpiresIn=expires_in
-            )
+            # Generate presigned URL with the shared client for the region, reusing a recent
+            # signature unless the URL is too short-lived to hand out one window late
+            s3_client = self.s3_client_for_region(region)
+            if expires_in > 2 * PRESIGN_CACHE_WINDOW:
+                window = int(time.time()) // PRESIGN_CACHE_WINDOW
+                presigned_url, signed_at = cached_presigned_url(s3_client, bucket, key, expires_in, window)
+            else:
+                presigned_url, signed_at = sign_presigned_url(s3_client, bucket, key, expires_in)
+            remaining = expires_in - int(time.time() - signed_at)
             
-            total_time = time.time()
-            print(f"Successfully generated presigned URL in {round((total_time - start_time) * 1000, 2)}ms")
-            return presigned_url
+            if self.server.verbose:
+                total_time = time.time()
+                self.log_notes.append(f"Successfully generated presigned URL in {round((total_time - start_time) * 1000, 2)}ms")
+            return presigned_url, remaining
             
         except NoCredentialsError:
             raise Exception("AWS credentials not found. Please configure your AWS credentials.")
@@ -306,24 +473,92 @@ class S3PresignerHandler(BaseHTTPRequestHandler):
         except Exception as e:
             raise Exception(f"Error generating presigned URL: {e}")
 
+    def s3_client_for_region(self, region):
+        """Return the shared S3 client for region, creating it on first use (None = default region)"""
+        server = self.server
+        s3_client = server.s3_clients.get(region)
+        if s3_client is None:
+            with server.s3_clients_lock:
+                s3_client = server.s3_clients.get(region)
+                if s3_client is None:
+                    # Explicit regional endpoint so the URL host matches the signing region
+                    s3_client = server.s3_session.client(
+                        's3',
+                        region_name=region,
+                        endpoint_url=f'https://s3.{region}.amazonaws.com',
+                        config=S3_CLIENT_CONFIG
+                    )
+                    server.s3_clients[region] = s3_client
+        return s3_client
+
     def log_message(self, format, *args):
         """Override to customize logging - suppress default HTTP logging since we have detailed logging"""
         # We suppress the default HTTP request logging since we have our own detailed logging
         pass
 
 
+class PooledHTTPServer(HTTPServer):
+    """HTTPServer that handles requests on a bounded pool of worker threads,
+    so a slow presign call doesn't block other clients and bursts can't spawn unbounded threads"""
+
+    def __init__(self, server_address, handler_class, max_workers=32):
+        super().__init__(server_address, handler_class)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='presigner')
+        # Open (possibly idle keep-alive) connections, closed on shutdown to release their workers
+        self._connections = set()
+        self._connections_lock = threading.Lock()
+
+    def process_request(self, request, client_address):
+        """Hand the accepted connection to a pool worker"""
+        with self._connections_lock:
+            self._connections.add(request)
+        self._pool.submit(self.process_request_thread, request, client_address)
+
+    def process_request_thread(self, request, client_address):
+        """Same as ThreadingMixIn.process_request_thread, run on a pool worker"""
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            with self._connections_lock:
+                self._connections.discard(request)
+
+    def server_close(self):
+        super().server_close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        with self._connections_lock:
+            for request in self._connections:
+                try:
+                    request.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+
 def main():
     parser = argparse.ArgumentParser(description='S3 Presigner Local Server')
     parser.add_argument('--port', type=int, default=8080, help='Port to run the server on (default: 8080)')
     parser.add_argument('--host', default='localhost', help='Host to bind to (default: localhost)')
+    parser.add_argument('--workers', type=int, default=32, help='Maximum concurrent request handler threads (default: 32)')
+    log_group = parser.add_mutually_exclusive_group()
+    log_group.add_argument('--verbose', action='store_true', help='Log full request/response details for every request')
+    log_group.add_argument('--quiet', action='store_true', help='Disable per-request logging')
     
     args = parser.parse_args()
     
-    # Test AWS credentials
+    # Resolve AWS credentials locally (environment/config/SSO) without an AWS API call;
+    # invalid keys surface on the first presigned URL that is used
     try:
-        s3_client = boto3.client('s3')
-        s3_client.list_buckets()  # Simple test to verify credentials
-        print("✅ AWS credentials verified")
+        session = boto3.Session()
+        credentials = session.get_credentials()
+        if credentials is None:
+            raise NoCredentialsError()
+        credentials.get_frozen_credentials()  # Runs the provider chain / refresh now
+
+        # Create the default-region S3 client once; clients are thread-safe and reused by all requests
+        s3_client = session.client('s3', config=S3_CLIENT_CONFIG)
+        print("✅ AWS credentials found")
     except NoCredentialsError:
         print("❌ AWS credentials not found!")
         print("Please configure your AWS credentials using one of these methods:")
@@ -337,11 +572,17 @@ def main():
 
     # Start the server
     server_address = (args.host, args.port)
-    httpd = HTTPServer(server_address, S3PresignerHandler)
+    httpd = PooledHTTPServer(server_address, S3PresignerHandler, max_workers=args.workers)
+    # Clients for regional S3 URLs are created on demand from the same session
+    httpd.s3_session = session
+    httpd.s3_clients = {None: s3_client}
+    httpd.s3_clients_lock = threading.Lock()
+    httpd.verbose = args.verbose
+    httpd.quiet = args.quiet
     
     print(f"🚀 S3 Presigner Server starting on http://{args.host}:{args.port}")
     print(f"📋 Usage:")
-    print(f"   GET:  http://{args.host}:{args.port}/?url=https://fleetdata-production.s3.amazonaws.com/path/file.txt")
+    print(f"   GET:  http://{args.host}:{args.port}/?url=https://fleetdata-production.s3.amazonaws.com/path/file.txt (add &pretty=1 for indented JSON)")
     print(f"   POST: http://{args.host}:{args.port}/ with JSON body: {{\"url\": \"https://...\"}}")
     print(f"💡 Press Ctrl+C to stop")
     